@@ -2,13 +2,68 @@
 
 import pandas as pd
 import numpy as np
-import json
+import bottleneck as bn
+import orjson
+import pyarrow as pa
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
 
+MONTH_COLUMNS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
+                 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+MONTH_NAMES = np.array(['January', 'February', 'March', 'April', 'May', 'June',
+                        'July', 'August', 'September', 'October', 'November', 'December'])
+METRIC_FIELDS = ['avg_monthly', 'max_monthly', 'min_monthly',
+                 'std_monthly', 'monsoon_percentage', 'peak_month']
+REQUIRED_COLUMNS = ['STATE_UT_NAME', 'DISTRICT'] + MONTH_COLUMNS + ['ANNUAL']
+MONSOON_COLUMN = 'Jun-Sep'
+COLUMN_DTYPES = {
+    'STATE_UT_NAME': 'string',
+    'DISTRICT': 'string',
+    **{col: 'float64' for col in MONTH_COLUMNS + ['ANNUAL', MONSOON_COLUMN]}
+}
+
+# Shared PCG64 generator for simulation noise
+_rng = np.random.default_rng()
+
+
+def _build_records(states: np.ndarray, districts: np.ndarray, months: np.ndarray,
+                   annual: np.ndarray, monsoon: np.ndarray, avg_monthly: np.ndarray,
+                   max_monthly: np.ndarray, min_monthly: np.ndarray, std_monthly: np.ndarray,
+                   monsoon_pct: np.ndarray, peak_month: np.ndarray) -> List[Dict]:
+    """
+    Assemble district dictionaries from aligned column arrays.
+    
+    Returns:
+        List of district dictionaries in output format
+    """
+    return [
+        {
+            'state': state,
+            'district': district,
+            'monthly': row,
+            'annual': ann,
+            'monsoon': mon,
+            'metrics': {
+                'avg_monthly': avg,
+                'max_monthly': mx,
+                'min_monthly': mn,
+                'std_monthly': sd,
+                'monsoon_percentage': pct,
+                'peak_month': peak
+            }
+        }
+        # tolist() converts each buffer to Python values in one C loop
+        for state, district, row, ann, mon, avg, mx, mn, sd, pct, peak in zip(
+            states.tolist(), districts.tolist(), months.tolist(),
+            annual.tolist(), monsoon.tolist(), avg_monthly.tolist(), max_monthly.tolist(),
+            min_monthly.tolist(), std_monthly.tolist(), monsoon_pct.tolist(), peak_month.tolist()
+        )
+    ]
+
+
 class FloodDataProcessor:
     """
     Main class for processing rainfall data and calculating flood parameters.
@@ -23,23 +78,32 @@ class FloodDataProcessor:
         """
         self.rainfall_csv_path = 'district_wise_rainfall_normal.csv'
         self.df = None
-        self.processed_data = []
+        self.processed_table = None
+        self._records = None
+        self._months_matrix = None
+        self._annual = None
+        self._monsoon = None
+        self._states_arr = None
+        self._districts_arr = None
         
     def load_data(self) -> pd.DataFrame:
         """Load rainfall data from CSV file."""
         print("📂 Loading rainfall data...")
-        self.df = pd.read_csv(self.rainfall_csv_path)
+        # Only parse the columns the pipeline uses, with fixed dtypes
+        header = pd.read_csv(self.rainfall_csv_path, nrows=0).columns
+        usecols = [col for col in REQUIRED_COLUMNS + [MONSOON_COLUMN] if col in header]
+        self.df = pd.read_csv(
+            self.rainfall_csv_path,
+            engine='pyarrow',
+            usecols=usecols,
+            dtype={col: COLUMN_DTYPES[col] for col in usecols}
+        )
         print(f"✓ Loaded {len(self.df)} districts from {self.df['STATE_UT_NAME'].nunique()} states")
         return self.df
     
     def validate_data(self) -> bool:
         """Validate that all required columns are present."""
-        required_columns = [
-            'STATE_UT_NAME', 'DISTRICT', 'JAN', 'FEB', 'MAR', 'APR', 
-            'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC', 'ANNUAL'
-        ]
-        
-        missing = [col for col in required_columns if col not in self.df.columns]
+        missing = [col for col in REQUIRED_COLUMNS if col not in self.df.columns]
         
         if missing:
             print(f"❌ Missing columns: {missing}")
@@ -48,67 +112,82 @@ class FloodDataProcessor:
         print("✓ Data validation passed")
         return True
     
-    def transform_data(self) -> List[Dict]:
+    def transform_data(self) -> pa.Table:
         """
-        Transform raw CSV data into structured JSON format.
+        Transform raw CSV data into a columnar district table.
         
         Returns:
-            List of district dictionaries with monthly rainfall data
+            Arrow table with one row per district; 'monthly' holds the
+            rainfall values ordered January through December as in
+            MONTH_NAMES and 'metrics' holds the per-district statistics
         """
         print("🔄 Transforming data...")
         
-        self.processed_data = []
-        
-        for _, row in self.df.iterrows():
-            district_data = {
-                'state': str(row['STATE_UT_NAME']),
-                'district': str(row['DISTRICT']),
-                'monthly': {
-                    'January': float(row['JAN']),
-                    'February': float(row['FEB']),
-                    'March': float(row['MAR']),
-                    'April': float(row['APR']),
-                    'May': float(row['MAY']),
-                    'June': float(row['JUN']),
-                    'July': float(row['JUL']),
-                    'August': float(row['AUG']),
-                    'September': float(row['SEP']),
-                    'October': float(row['OCT']),
-                    'November': float(row['NOV']),
-                    'December': float(row['DEC'])
-                },
-                'annual': float(row['ANNUAL']),
-                'monsoon': float(row['Jun-Sep']) if 'Jun-Sep' in row else 0.0
-            }
-            
-            # Add calculated metrics
-            district_data['metrics'] = self.calculate_district_metrics(district_data)
-            
-            self.processed_data.append(district_data)
-        
-        print(f"✓ Transformed {len(self.processed_data)} district records")
-        return self.processed_data
+        months = np.ascontiguousarray(self.df[MONTH_COLUMNS].to_numpy(dtype=np.float64))
+        annual = self.df['ANNUAL'].to_numpy(dtype=np.float64)
+        if MONSOON_COLUMN in self.df.columns:
+            monsoon = self.df[MONSOON_COLUMN].to_numpy(dtype=np.float64)
+        else:
+            monsoon = np.zeros(len(self.df))
+        
+        # Keep the column vectors around for the reporting methods;
+        # the table below wraps the same buffers without copying
+        self._months_matrix = months
+        self._annual = annual
+        self._monsoon = monsoon
+        # Blank name cells become None, which Arrow and orjson store as null
+        self._states_arr = self.df['STATE_UT_NAME'].to_numpy(dtype=object, na_value=None)
+        self._districts_arr = self.df['DISTRICT'].to_numpy(dtype=object, na_value=None)
+        
+        # Per-district metrics in one pass over the N x 12 matrix
+        avg_monthly = months.mean(axis=1)
+        max_monthly = months.max(axis=1)
+        min_monthly = months.min(axis=1)
+        std_monthly = months.std(axis=1)
+        peak_month = MONTH_NAMES[months.argmax(axis=1)]
+        monsoon_pct = np.divide(monsoon, annual, out=np.zeros_like(annual), where=annual > 0) * 100
+        
+        self.processed_table = pa.table({
+            'state': pa.array(self._states_arr, pa.string()),
+            'district': pa.array(self._districts_arr, pa.string()),
+            'monthly': pa.FixedSizeListArray.from_arrays(pa.array(months.ravel()), len(MONTH_NAMES)),
+            'annual': pa.array(annual),
+            'monsoon': pa.array(monsoon),
+            'metrics': pa.StructArray.from_arrays(
+                [pa.array(values) for values in (avg_monthly, max_monthly, min_monthly,
+                                                 std_monthly, monsoon_pct, peak_month)],
+                names=METRIC_FIELDS
+            )
+        })
+        self._records = None
+        
+        print(f"✓ Transformed {self.processed_table.num_rows} district records")
+        return self.processed_table
     
-    def calculate_district_metrics(self, district: Dict) -> Dict:
+    def get_records(self) -> List[Dict]:
         """
-        Calculate statistical metrics for a district.
+        Materialize the processed table as district dictionaries for output.
         
-        Args:
-            district: District data dictionary
-            
         Returns:
-            Dictionary of calculated metrics
+            List of district dictionaries in JSON output format
         """
-        monthly_values = list(district['monthly'].values())
-        
-        return {
-            'avg_monthly': np.mean(monthly_values),
-            'max_monthly': np.max(monthly_values),
-            'min_monthly': np.min(monthly_values),
-            'std_monthly': np.std(monthly_values),
-            'monsoon_percentage': (district['monsoon'] / district['annual'] * 100) if district['annual'] > 0 else 0,
-            'peak_month': max(district['monthly'].items(), key=lambda x: x[1])[0]
-        }
+        if self._records is not None:
+            return self._records
+        
+        table = self.processed_table
+        metrics = table['metrics'].combine_chunks()
+        monthly = table['monthly'].combine_chunks().flatten()
+        columns = (
+            table['state'].to_numpy(),
+            table['district'].to_numpy(),
+            monthly.to_numpy(zero_copy_only=False).reshape(-1, len(MONTH_NAMES)),
+            table['annual'].to_numpy(),
+            table['monsoon'].to_numpy(),
+            *(metrics.field(name).to_numpy(zero_copy_only=False) for name in METRIC_FIELDS)
+        )
+        
+        self._records = _build_records(*columns)
+        return self._records
     
     def save_output(self, output_path: str = 'complete_rainfall_data.json'):
         """
@@ -119,10 +198,26 @@ class FloodDataProcessor:
         """
         print(f"💾 Saving processed data to {output_path}...")
         
-        with open(output_path, 'w') as f:
-            json.dump(self.processed_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(self.get_records(), option=orjson.OPT_SERIALIZE_NUMPY))
+        
+        print(f"✓ Data saved successfully ({self.processed_table.num_rows} districts)")
+    
+    def save_ndjson(self, output_path: str = 'complete_rainfall_data.ndjson'):
+        """
+        Save processed data as newline-delimited JSON, one district per line.
+        
+        Args:
+            output_path: Path for output NDJSON file
+        """
+        print(f"💾 Saving processed data to {output_path}...")
+        
+        with open(output_path, 'wb') as f:
+            for district in self.get_records():
+                f.write(orjson.dumps(district, option=orjson.OPT_SERIALIZE_NUMPY |
+                                     orjson.OPT_APPEND_NEWLINE))
         
-        print(f"✓ Data saved successfully ({len(self.processed_data)} districts)")
+        print(f"✓ Data saved successfully ({self.processed_table.num_rows} districts)")
     
     def generate_summary_report(self) -> Dict:
         """
@@ -131,30 +226,16 @@ class FloodDataProcessor:
         Returns:
             Dictionary containing summary statistics
         """
-        states = list(set([d['state'] for d in self.processed_data]))
-        
-        annual_rainfall = [d['annual'] for d in self.processed_data]
-        monsoon_rainfall = [d['monsoon'] for d in self.processed_data]
+        states = np.sort([state for state in pd.unique(self._states_arr)
+                          if state is not None]).tolist()
         
         report = {
-            'total_districts': len(self.processed_data),
+            'total_districts': self.processed_table.num_rows,
             'total_states': len(states),
-            'states': sorted(states),
+            'states': states,
             'rainfall_statistics': {
-                'annual': {
-                    'mean': np.mean(annual_rainfall),
-                    'median': np.median(annual_rainfall),
-                    'min': np.min(annual_rainfall),
-                    'max': np.max(annual_rainfall),
-                    'std': np.std(annual_rainfall)
-                },
-                'monsoon': {
-                    'mean': np.mean(monsoon_rainfall),
-                    'median': np.median(monsoon_rainfall),
-                    'min': np.min(monsoon_rainfall),
-                    'max': np.max(monsoon_rainfall),
-                    'std': np.std(monsoon_rainfall)
-                }
+                'annual': self._describe(self._annual),
+                'monsoon': self._describe(self._monsoon)
             },
             'top_rainfall_districts': self.get_top_districts(5),
             'high_risk_districts': self.identify_high_risk_districts()
@@ -162,17 +243,37 @@ class FloodDataProcessor:
         
         return report
     
+    @staticmethod
+    def _describe(values: np.ndarray) -> Dict:
+        """Compute NaN-aware mean, median, min, max and std of a rainfall array."""
+        return {
+            'mean': bn.nanmean(values),
+            'median': bn.nanmedian(values),
+            'min': bn.nanmin(values),
+            'max': bn.nanmax(values),
+            'std': bn.nanstd(values)
+        }
+    
     def get_top_districts(self, n: int = 5) -> List[Dict]:
         """Get top N districts by annual rainfall."""
-        sorted_districts = sorted(self.processed_data, 
-                                 key=lambda x: x['annual'], 
-                                 reverse=True)
+        # Missing values partition to the end and never make the top n
+        n = min(n, np.count_nonzero(~np.isnan(self._annual)))
+        if n <= 0:
+            return []
+        
+        # Partition to find the n-th largest value, then keep every row at or
+        # above it so ties at the cut-off are resolved in file order
+        cutoff = self._annual[np.argpartition(-self._annual, n - 1)[n - 1]]
+        idx = np.flatnonzero(self._annual >= cutoff)
+        idx = idx[np.argsort(-self._annual[idx], kind='stable')][:n]
         
         return [{
-            'district': d['district'],
-            'state': d['state'],
-            'annual_rainfall': d['annual']
-        } for d in sorted_districts[:n]]
+            'district': district,
+            'state': state,
+            'annual_rainfall': annual
+        } for district, state, annual in zip(
+            self._districts_arr[idx], self._states_arr[idx], self._annual[idx]
+        )]
     
     def identify_high_risk_districts(self, threshold: float = 3000) -> List[Dict]:
         """
@@ -184,18 +285,21 @@ class FloodDataProcessor:
         Returns:
             List of high-risk districts
         """
-        high_risk = [
+        idx = np.flatnonzero(self._annual > threshold)
+        idx = idx[np.argsort(-self._annual[idx], kind='stable')]
+        
+        return [
             {
-                'district': d['district'],
-                'state': d['state'],
-                'annual_rainfall': d['annual'],
-                'monsoon_rainfall': d['monsoon']
+                'district': district,
+                'state': state,
+                'annual_rainfall': annual,
+                'monsoon_rainfall': monsoon
             }
-            for d in self.processed_data 
-            if d['annual'] > threshold
+            for district, state, annual, monsoon in zip(
+                self._districts_arr[idx], self._states_arr[idx],
+                self._annual[idx], self._monsoon[idx]
+            )
         ]
-        
-        return sorted(high_risk, key=lambda x: x['annual_rainfall'], reverse=True)
     
     def print_summary(self, report: Dict):
         """Print a formatted summary report."""
@@ -272,6 +376,37 @@ class HydrologicalSimulator:
         runoff = ((rainfall - ia) ** 2) / (rainfall - ia + s)
         return runoff
     
+    @staticmethod
+    def calculate_runoff_array(rainfall: np.ndarray,
+                               soil_type: Union[str, np.ndarray] = 'medium') -> np.ndarray:
+        """
+        Calculate surface runoff for many rainfall values at once.
+        
+        Vectorized counterpart of calculate_runoff for running the SCS
+        Curve Number method over every district in a single pass.
+        
+        Args:
+            rainfall: Array of precipitation amounts in mm
+            soil_type: Soil type for all values, or an array of soil types
+                       broadcastable against rainfall
+            
+        Returns:
+            Array of runoff amounts in mm
+        """
+        # Curve numbers for 'high', 'medium' and 'low' infiltration soils
+        curve_numbers = np.array([85, 70, 55])
+        
+        soil_type = np.asarray(soil_type)
+        soil_idx = np.select([soil_type == 'high', soil_type == 'low'], [0, 2], default=1)
+        cn = np.take(curve_numbers, soil_idx)
+        
+        s = (25400 / cn) - 254
+        ia = 0.2 * s
+        
+        # Rainfall below the initial abstraction produces no runoff
+        excess = np.maximum(np.asarray(rainfall, dtype=np.float64) - ia, 0)
+        return excess ** 2 / (excess + s)
+    
     @staticmethod
     def calculate_water_level(runoff: float, area_km2: float = 100) -> float:
         """
@@ -319,38 +454,45 @@ class HydrologicalSimulator:
             return 'LOW', 1
     
     @staticmethod
-    def simulate_flood_progression(rainfall: float, duration_hours: int = 72) -> List[float]:
+    def simulate_flood_progression(rainfall: float, duration_hours: int = 72,
+                                   rng: Optional[np.random.Generator] = None) -> List[float]:
         """
         Simulate flood water level progression over time.
         
         Args:
             rainfall: Total rainfall in mm
             duration_hours: Simulation duration in hours
+            rng: Random generator for the level noise; pass a seeded
+                 np.random.default_rng(seed) for reproducible runs
             
         Returns:
             List of water levels for each hour
+            
+        Raises:
+            ValueError: If duration_hours is not positive
         """
-        water_levels = []
+        if duration_hours <= 0:
+            raise ValueError(f"duration_hours must be positive, got {duration_hours}")
         
-        for hour in range(duration_hours + 1):
-            progress = hour / duration_hours
-            
-            # Peak at 70% of duration
-            peak_time = 0.7
-            
-            if progress < peak_time:
-                # Rising phase (exponential growth)
-                level = (rainfall / 100) * (progress / peak_time) ** 1.5
-            else:
-                # Recession phase (exponential decay)
-                recession_factor = (progress - peak_time) / (1 - peak_time)
-                level = (rainfall / 100) * (1 - recession_factor) ** 2
-            
-            # Add random variation (±10%)
-            level += level * np.random.uniform(-0.1, 0.1)
-            water_levels.append(max(0, level))
+        progress = np.arange(duration_hours + 1) / duration_hours
+        
+        # Peak at 70% of duration
+        peak_time = 0.7
+        
+        # Rising phase (exponential growth) before the peak,
+        # recession phase (exponential decay) after it
+        recession_factor = (progress - peak_time) / (1 - peak_time)
+        levels = (rainfall / 100) * np.where(
+            progress < peak_time,
+            (progress / peak_time) ** 1.5,
+            (1 - recession_factor) ** 2
+        )
+        
+        # Add random variation (±10%)
+        rng = _rng if rng is None else rng
+        levels += levels * rng.uniform(-0.1, 0.1, size=levels.size)
         
-        return water_levels
+        return np.maximum(levels, 0).tolist()
 
 
 def main():
@@ -375,18 +517,20 @@ def main():
     
     # Save processed data
     processor.save_output('./complete_rainfall_data.json')
+    processor.save_ndjson('./complete_rainfall_data.ndjson')
     
     # Generate and display summary report
     report = processor.generate_summary_report()
     processor.print_summary(report)
     
     # Save summary report
-    with open('./summary_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    with open('./summary_report.json', 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     print("\n✨ Processing complete!")
     print("📁 Output files:")
     print("   • complete_rainfall_data.json - Full processed dataset")
+    print("   • complete_rainfall_data.ndjson - Same dataset, one district per line")
     print("   • summary_report.json - Statistical summary")
     
     # Demonstrate hydrological simulation